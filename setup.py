@@ -1,4 +1,4 @@
-from setuptools import find_packages, setup
+from setuptools import setup
 
 
 with open('README.md', encoding='utf8') as file:
@@ -13,7 +13,7 @@ setup(
     author_email='maxrmorrison@gmail.com',
     url='https://github.com/maxrmorrison/yapecs',
     install_requires=['filelock'],
-    packages=find_packages(),
+    packages=['yapecs'],
     long_description=long_description,
     long_description_content_type='text/markdown',
     keywords=['configuration', 'config', 'experiment', 'manager'])
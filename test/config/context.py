@@ -0,0 +1,4 @@
+MODULE = 'weather'
+
+# Number of items in a batch
+BATCH_SIZE = 128
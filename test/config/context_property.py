@@ -0,0 +1,15 @@
+MODULE = 'weather'
+
+import yapecs
+
+
+# Whether to use the average temperature as a feature
+@yapecs.ComputedProperty(compute_once=False)
+def AVERAGE_TEMP_FEATURE():
+    return False
+
+
+# Number of items in a batch
+@yapecs.ComputedProperty(compute_once=False)
+def BATCH_SIZE():
+    return 256
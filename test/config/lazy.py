@@ -0,0 +1,9 @@
+MODULE = 'lazy'
+
+import yapecs
+
+
+# Number of items in a batch
+@yapecs.ComputedProperty(compute_once=False)
+def BATCH_SIZE():
+    return 256
@@ -0,0 +1,10 @@
+MODULE = 'weather'
+
+import yapecs
+import weather
+
+
+# Whether to use the average temperature as a feature
+@yapecs.ComputedProperty(compute_once=False)
+def AVERAGE_TEMP_FEATURE():
+    return weather.TODAYS_TEMP_FEATURE
@@ -1,5 +1,6 @@
 import importlib
 from pathlib import Path
+from types import ModuleType
 
 import yapecs
 
@@ -9,6 +10,21 @@ import yapecs
 ###############################################################################
 
 
+def test_cached_property():
+    """Test yapecs computed properties that are computed once"""
+    weather_compose = yapecs.compose(
+        'weather',
+        [Path(__file__).parent / 'config' / 'cached_property.py'])
+
+    # Check that value is computed
+    assert weather_compose.AVERAGE_TEMP_FEATURE
+    assert 'AVERAGE_TEMP_FEATURE' in vars(weather_compose)
+
+    # Check that value is not recomputed
+    weather_compose.TODAYS_TEMP_FEATURE = False
+    assert weather_compose.AVERAGE_TEMP_FEATURE
+
+
 def test_compose():
     """Test yapecs configuration composition"""
     # Import module
@@ -27,6 +43,57 @@ def test_compose():
     assert not weather_compose.TODAYS_TEMP_FEATURE
 
 
+def test_compose_failure():
+    """Test that failed composition reverts its changes"""
+    import sys
+    import weather
+    modules = dict(sys.modules)
+    argv = list(sys.argv)
+
+    # Compose with a missing configuration file
+    try:
+        yapecs.compose(
+            'weather',
+            [
+                Path(__file__).parent / 'config' / 'config.py',
+                Path(__file__).parent / 'config' / 'missing.py'])
+        assert False
+    except FileNotFoundError:
+        pass
+
+    # Check that sys.modules, sys.argv, and the lock are restored
+    assert sys.modules == modules
+    assert sys.modules['weather'] is weather
+    assert sys.argv == argv
+    assert not yapecs.core._COMPOSE_LOCK.locked()
+
+
+def test_compose_module_names():
+    """Test yapecs configuration composition with given module names"""
+    import sys
+    import weather
+    config_file = Path(__file__).parent / 'config' / 'config.py'
+
+    # Compose without reading the module name from the config
+    weather_compose = yapecs.compose('weather', [config_file], ['weather'])
+    assert weather.TODAYS_TEMP_FEATURE
+    assert not weather_compose.TODAYS_TEMP_FEATURE
+    assert sys.modules['weather'] is weather
+
+    # Check that invalid compositions do not modify sys.modules
+    modules = dict(sys.modules)
+    for module_names, argv in [([], []), (['weather'], ['--config', 'a'])]:
+        sys.argv.extend(argv)
+        try:
+            yapecs.compose('weather', [config_file], module_names)
+            assert False
+        except ValueError:
+            pass
+        finally:
+            del sys.argv[len(sys.argv) - len(argv):]
+        assert sys.modules == modules
+
+
 def test_configuration():
     """Test yapecs configuration"""
     # NOTE - This is just for testing purposes and is not a valid way to
@@ -51,6 +118,170 @@ def test_configuration():
     # Check that value was updated
     assert not weather.TODAYS_TEMP_FEATURE
 
+
+def test_configuration_argument():
+    """Test reading configuration files from the command line"""
+    import sys
+    config_file = str(Path(__file__).parent / 'config' / 'config.py')
+    argv = list(sys.argv)
+    try:
+        for arguments in [
+            ['--config', config_file],
+            [f'--config={config_file}']
+        ]:
+            sys.argv[1:] = arguments + ['--batch_size', '128']
+            assert yapecs.core._cli_configs() == [config_file]
+    finally:
+        sys.argv[:] = argv
+
+
+def test_configuration_equality():
+    """Test configuring values that cannot be compared"""
+    config = yapecs.import_from_path(
+        'config',
+        Path(__file__).parent / 'config' / 'equality.py')
+    defaults = ModuleType('defaults')
+    defaults.VALUE = config.Array()
+
+    # Check that value is updated without comparing values
+    yapecs.configure('equality', defaults, config)
+    assert defaults.VALUE is config.VALUE
+
+
+def test_context():
+    """Test temporary yapecs configuration"""
+    # Import module
+    import weather
+
+    # Check that value is as expected
+    assert weather.BATCH_SIZE == 64
+
+    # Temporarily modify configuration
+    with yapecs.context(
+        weather,
+        weather.config.defaults,
+        Path(__file__).parent / 'config' / 'context.py'
+    ):
+
+        # Check that value was updated
+        assert weather.BATCH_SIZE == 128
+        assert weather.config.defaults.BATCH_SIZE == 128
+
+    # Check that value was reverted
+    assert weather.BATCH_SIZE == 64
+    assert weather.config.defaults.BATCH_SIZE == 64
+
+    # Temporarily modify derived parameters
+    def refresh(module):
+        module.NUM_FEATURES = module.BATCH_SIZE
+    with yapecs.context(
+        weather,
+        weather.config.defaults,
+        Path(__file__).parent / 'config' / 'context.py',
+        refresh
+    ):
+        assert weather.NUM_FEATURES == 128
+
+    # Check that derived parameter was reverted
+    assert weather.NUM_FEATURES == 2
+
+
+def test_context_import():
+    """Test importing submodules within a temporary configuration"""
+    import sys
+    import weather
+    sys.modules.pop('weather.evaluate', None)
+    vars(weather).pop('evaluate', None)
+
+    # Import submodule within the context
+    with yapecs.context(
+        weather,
+        weather.config.defaults,
+        Path(__file__).parent / 'config' / 'context.py'
+    ):
+        import weather.evaluate
+
+    # Check that submodule is still accessible
+    import weather.evaluate
+    assert weather.evaluate.NUM_EXAMPLES == 1024
+
+
+def test_context_property():
+    """Test temporary yapecs configuration with computed properties"""
+    import weather
+    hook = vars(weather).get('__getattr__')
+    properties = getattr(hook, 'properties', None)
+    weather_compose = yapecs.compose(
+        'weather',
+        [Path(__file__).parent / 'config' / 'property.py'])
+
+    # Temporarily modify a computed property of a composed module
+    with yapecs.context(
+        weather_compose,
+        weather_compose.config.defaults,
+        Path(__file__).parent / 'config' / 'context_property.py'
+    ):
+        assert not weather_compose.AVERAGE_TEMP_FEATURE
+
+        # Check that values can be replaced with properties
+        assert weather_compose.BATCH_SIZE == 256
+
+    # Check that property and value were reverted
+    assert weather_compose.AVERAGE_TEMP_FEATURE
+    assert weather_compose.BATCH_SIZE == 64
+
+    # Check that the imported module was not modified
+    hook = vars(weather).get('__getattr__')
+    assert getattr(hook, 'properties', None) is properties
+
+    # Temporarily modify computed properties that were already computed
+    for config_file in ['cached_property.py', 'property.py']:
+        weather_compose = yapecs.compose(
+            'weather',
+            [Path(__file__).parent / 'config' / config_file])
+        assert weather_compose.AVERAGE_TEMP_FEATURE
+        yapecs.finalize(weather_compose)
+        with yapecs.context(
+            weather_compose,
+            weather_compose.config.defaults,
+            Path(__file__).parent / 'config' / 'context_property.py'
+        ):
+            assert not weather_compose.AVERAGE_TEMP_FEATURE
+
+        # Check that computed value was reverted
+        assert weather_compose.AVERAGE_TEMP_FEATURE
+
+
+def test_finalize():
+    """Test replacing yapecs computed properties with their values"""
+    weather_compose = yapecs.compose(
+        'weather',
+        [Path(__file__).parent / 'config' / 'property.py'])
+
+    # Replace properties with values
+    yapecs.finalize(weather_compose)
+    assert weather_compose.AVERAGE_TEMP_FEATURE
+    assert 'AVERAGE_TEMP_FEATURE' in vars(weather_compose)
+
+    # Check that value is not recomputed
+    weather_compose.TODAYS_TEMP_FEATURE = False
+    assert weather_compose.AVERAGE_TEMP_FEATURE
+
+
+def test_grid_iter():
+    """Test yapecs grid_iter"""
+    progress_file = Path(__file__).parent / 'config' / 'grid_iter.progress'
+    if progress_file.exists():
+        progress_file.unlink()
+
+    # Check that iteration matches the order of grid search
+    args = ([1e-5, 1e-4], [64, 128], [True, False])
+    for combination in yapecs.grid_iter(*args):
+        assert yapecs.grid_search(progress_file, *args) == combination
+    progress_file.unlink()
+    Path(str(progress_file) + '.lock').unlink(missing_ok=True)
+
+
 def test_grid_search():
     """Test yapecs grid_search"""
     import weather
@@ -79,4 +310,39 @@ def test_grid_search():
     
     assert weather_third.LEARNING_RATE == 1e-5
     assert weather_third.BATCH_SIZE == 128
-    assert weather_third.AVERAGE_TEMP_FEATURE == True
\ No newline at end of file
+    assert weather_third.AVERAGE_TEMP_FEATURE == True
+
+
+def test_property():
+    """Test yapecs computed properties"""
+    weather_compose = yapecs.compose(
+        'weather',
+        [Path(__file__).parent / 'config' / 'property.py'])
+
+    # Check that value is computed
+    assert weather_compose.AVERAGE_TEMP_FEATURE
+
+    # Check that value is recomputed
+    weather_compose.TODAYS_TEMP_FEATURE = False
+    assert not weather_compose.AVERAGE_TEMP_FEATURE
+
+
+def test_property_fallback():
+    """Test yapecs computed properties of modules with their own hook"""
+    import sys
+    module = ModuleType('lazy')
+    module.__getattr__ = lambda name: name.lower()
+    defaults = ModuleType('defaults')
+    defaults.BATCH_SIZE = 64
+    sys.modules['lazy'] = module
+    try:
+        yapecs.configure(
+            'lazy',
+            defaults,
+            Path(__file__).parent / 'config' / 'lazy.py')
+
+        # Check that both the property and the module hook are accessible
+        assert module.BATCH_SIZE == 256
+        assert module.LAZY == 'lazy'
+    finally:
+        del sys.modules['lazy']
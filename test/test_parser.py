@@ -0,0 +1,69 @@
+import argparse
+
+import yapecs
+
+
+###############################################################################
+# Test yapecs.ArgumentParser
+###############################################################################
+
+
+def test_config():
+    """Test that parsing removes the yapecs --config argument"""
+    parser = yapecs.ArgumentParser()
+    parser.add_argument('--batch_size', type=int, default=64)
+    for args in [
+        ['--config', 'a.py', 'b.py', '--batch_size', '128'],
+        ['--config=a.py', '--batch_size', '128']
+    ]:
+        assert vars(parser.parse_args(args)) == {'batch_size': 128}
+
+        # Check that the configuration files are not left over
+        assert parser.parse_known_args(args)[1] == []
+
+    # Check that --config is documented
+    assert '--config' in parser.format_help()
+
+
+def test_config_defined():
+    """Test parsers that define their own --config argument"""
+    parent = argparse.ArgumentParser(add_help=False)
+    parent.add_argument('--config')
+    parser = yapecs.ArgumentParser(parents=[parent])
+    assert parser.parse_args(['--config', 'a.py']).config == 'a.py'
+
+    # Check that parsers inheriting the yapecs argument remove it
+    parser = yapecs.ArgumentParser(
+        parents=[yapecs.ArgumentParser(add_help=False)])
+    assert 'config' not in parser.parse_args(['--config', 'a.py'])
+
+
+def test_defaults():
+    """Test that parsing uses the current argument defaults"""
+    parser = yapecs.ArgumentParser()
+    parser.add_argument('--batch_size', type=int, default=64)
+    assert parser.parse_args([]).batch_size == 64
+
+    # Change default after parsing
+    parser.set_defaults(batch_size=128)
+    assert parser.parse_args([]).batch_size == 128
+
+
+def test_import():
+    """Test importing the argument parser from yapecs.core"""
+    from yapecs.core import ArgumentParser
+    assert ArgumentParser is yapecs.ArgumentParser
+
+    # Check that star imports export the argument parser
+    namespace = {}
+    exec('from yapecs.core import *', namespace)
+    assert namespace['ArgumentParser'] is yapecs.ArgumentParser
+
+
+def test_mutation():
+    """Test that modifying parsed arguments does not affect later parsing"""
+    parser = yapecs.ArgumentParser()
+    parser.add_argument('--items', nargs='+')
+    arguments = parser.parse_args(['--items', 'x'])
+    arguments.items.append('y')
+    assert parser.parse_args(['--items', 'x']).items == ['x']
@@ -0,0 +1,2 @@
+# Number of examples to evaluate
+NUM_EXAMPLES = 1024
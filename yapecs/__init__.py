@@ -1 +1,20 @@
-from .core import *
+from . import core
+from .core import __all__
+from .core import (
+    ComputedProperty,
+    clear_config_cache,
+    compose,
+    configure,
+    context,
+    finalize,
+    grid_iter,
+    grid_search,
+    import_from_path,
+    restore,
+    snapshot)
+
+
+def __getattr__(name):
+    # Defer to yapecs.core, which imports argparse only when the argument
+    # parser is used
+    return getattr(core, name)
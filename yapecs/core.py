@@ -1,14 +1,51 @@
-import argparse
-import importlib.util
+import ast
+import contextlib
+import importlib.machinery
 import itertools
+import math
 import os
+import re
 import sys
-from copy import copy
+import threading
 from pathlib import Path
 from types import ModuleType
-from typing import List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
-from filelock import FileLock
+
+__all__ = [
+    'ArgumentParser',
+    'ComputedProperty',
+    'clear_config_cache',
+    'compose',
+    'configure',
+    'context',
+    'finalize',
+    'grid_iter',
+    'grid_search',
+    'import_from_path',
+    'restore',
+    'snapshot']
+
+
+# Compiled configuration files, keyed by file (see _cache_key)
+_CONFIG_CODE_CACHE = {}
+
+# Module names of configuration files, keyed by file (see _cache_key)
+_MODULE_NAME_CACHE = {}
+
+# A top-level assignment of a string to MODULE
+_MODULE_PATTERN = re.compile(
+    r'^MODULE[ \t]*=[ \t]*([\'"])([^\'"\\]*)\1[ \t]*(#.*)?$',
+    re.MULTILINE)
+
+# Types of configuration values that are compared before being updated
+_SCALAR_TYPES = (bool, float, int, str, type(None))
+
+# Configuration files parsed from the command line, keyed by sys.argv
+_ARGV_CACHE = {}
+
+# Lock held while composing a module
+_COMPOSE_LOCK = threading.Lock()
 
 
 ###############################################################################
@@ -19,7 +56,7 @@ from filelock import FileLock
 def configure(
     module_name: str,
     config_module: ModuleType,
-    config: Optional[Union[str, Path]] = None
+    config: Optional[Union[str, Path, ModuleType]] = None
 ) -> None:
     """Update the configuration values
 
@@ -29,55 +66,368 @@ def configure(
         config_module
             The submodule containing configuration values
         config
-            The Python file containing the updated configuration values.
+            The Python file containing the updated configuration values, or
+            the module already loaded from that file.
             If not provided and the ``--config`` parameter is a command-line
             argument, the corresponding argument is used as the configuration
     """
-    # Get config file
-    if config is None:
+    _configure(
+        module_name,
+        config_module,
+        config,
+        sys.modules.get(module_name))
 
-        # Get argv index of configuration
-        try:
-            index = sys.argv.index('--config')
-        except:
-            return
-        if index == -1 or index + 1 == len(sys.argv):
-            return
-
-        # Get all configurations
-        configs = []
-        i = index + 1
-        while i < len(sys.argv) and not str(sys.argv[i]).startswith('--'):
-            path = Path(sys.argv[i])
-
-            # Raise if config file doesn't exist
-            if not path.is_file():
-                raise FileNotFoundError(
-                    f'Configuration file {path} does not exist')
-
-            configs.append(path)
-            i += 1
 
+def _configure(
+    module_name: str,
+    config_module: ModuleType,
+    config: Optional[Union[str, Path, ModuleType]],
+    module: Optional[ModuleType]
+) -> None:
+    """Update the configuration values of a given module
+
+    Arguments
+        module_name
+            The name of the module to configure
+        config_module
+            The submodule containing configuration values
+        config
+            The configuration (see configure)
+        module
+            The module that computed properties are accessed from, or None
+            if it has not been imported
+    """
+    # Get config file
+    if config is not None:
+        configs = [config]
+
+    # Get config files from the command line
     else:
-        configs  = [config]
+        configs = _cli_configs()
+
+    # Get computed properties, which are stored separately from values so
+    # that they are not copied by ``from ... import *``
+    destination = vars(config_module)
+    properties = dict(_properties(config_module))
 
     # Find the configuration with the matching module name
     for config in configs:
 
         # Load config file as a module
-        updated_module = import_from_path('config', config)
+        updated_module = _load_config(config, module_name)
 
         # Only update when the module name matches
-        if updated_module.MODULE != module_name:
+        if updated_module is None:
             continue
 
         # Merge config module and default config module
-        for parameter in dir(updated_module):
-            if hasattr(config_module, parameter):
-                setattr(
-                    config_module,
-                    parameter,
-                    getattr(updated_module, parameter))
+        _merge(destination, properties, vars(updated_module))
+
+    # Make computed properties accessible from the configured module. The
+    # properties are replaced rather than modified in place so that
+    # yapecs.restore also reverts them.
+    destination['__yapecs_properties__'] = properties
+    if module is not None:
+        _install_properties(module, properties)
+
+
+def _merge(
+    destination: Dict[str, Any],
+    properties: Dict[str, 'ComputedProperty'],
+    config: Dict[str, Any]
+) -> None:
+    """Merge configuration values into a module
+
+    Arguments
+        destination
+            The attributes of the module containing configuration values
+        properties
+            The computed properties of that module, updated in place
+        config
+            The attributes of the module containing the updated values
+    """
+    updates = {}
+    for parameter, value in config.items():
+        if parameter.startswith('_') or parameter == 'MODULE':
+            continue
+
+        # Replace computed properties with properties or values
+        if parameter in properties:
+            if isinstance(value, ComputedProperty):
+                properties[parameter] = value
+            else:
+                del properties[parameter]
+                updates[parameter] = value
+            continue
+
+        if parameter not in destination:
+            continue
+        current = destination[parameter]
+
+        # Skip values that are unchanged. Only scalars are compared, as
+        # comparing other values (e.g., arrays) can raise. Values of
+        # different types (e.g., 1 and 1.0) are always updated.
+        if current is value or (
+            type(current) is type(value) and
+            type(value) in _SCALAR_TYPES and
+            current == value
+        ):
+            continue
+
+        # Replace values with computed properties
+        if isinstance(value, ComputedProperty):
+            del destination[parameter]
+            properties[parameter] = value
+            continue
+
+        updates[parameter] = value
+    destination.update(updates)
+
+
+###############################################################################
+# Computed properties
+###############################################################################
+
+
+class ComputedProperty:
+
+    __slots__ = ('compute_once', 'getter')
+
+    def __init__(self, compute_once: bool = False):
+        """Decorator for configuration values computed on access. The
+        decorated function takes no arguments and returns the value.
+
+        Arguments
+            compute_once
+                Whether to only compute the value on first access
+        """
+        self.compute_once = compute_once
+        self.getter = None
+
+    def __call__(self, getter: Callable[[], Any]) -> 'ComputedProperty':
+        """Set the function that computes the value
+
+        Arguments
+            getter
+                The function that computes the value
+
+        Returns
+            The computed property
+        """
+        self.getter = getter
+        return self
+
+
+def _properties(config_module: ModuleType) -> Dict[str, ComputedProperty]:
+    """Get the computed properties of a config module, moving them out of
+    the module attributes the first time the module is configured
+
+    Arguments
+        config_module
+            The submodule containing configuration values
+
+    Returns
+        properties
+            The computed properties, keyed by parameter name
+    """
+    attributes = vars(config_module)
+    try:
+        return attributes['__yapecs_properties__']
+    except KeyError:
+        pass
+
+    properties = {
+        parameter: value for parameter, value in attributes.items()
+        if isinstance(value, ComputedProperty)}
+    for parameter in properties:
+        del attributes[parameter]
+    attributes['__yapecs_properties__'] = properties
+    return properties
+
+
+def _install_properties(
+    module: ModuleType,
+    properties: Dict[str, ComputedProperty]
+) -> None:
+    """Make computed properties accessible as module attributes
+
+    Arguments
+        module
+            The module to add properties to
+        properties
+            The computed properties, keyed by parameter name
+    """
+    hook = vars(module).get('__getattr__')
+    installed = getattr(hook, 'properties', None) is not None
+    if not properties and not installed:
+        return
+
+    # Store getters separately depending on whether they are computed once,
+    # so that accessing a property is a single dict lookup and call
+    getters, once = {}, {}
+    for name, prop in properties.items():
+        (once if prop.compute_once else getters)[name] = prop.getter
+
+    # Reuse the hook installed when the module was previously configured
+    if installed:
+        hook.properties = getters, once
+        return
+
+    # Keep the module's own hook, if it defines one
+    fallback = hook if callable(hook) else None
+
+    def __getattr__(name: str) -> Any:
+        getters, once = __getattr__.properties
+        getter = getters.get(name)
+        if getter is not None:
+            return getter()
+
+        getter = once.get(name)
+        if getter is None:
+
+            # Fall back to the module's own hook (e.g., for lazy imports)
+            if fallback is not None:
+                return fallback(name)
+
+            raise AttributeError(
+                f'module {module.__name__!r} has no attribute {name!r}')
+
+        # Replace properties that are computed once with their value, so
+        # subsequent accesses are plain module attribute lookups
+        value = vars(module)[name] = getter()
+        del once[name]
+
+        return value
+
+    __getattr__.properties = getters, once
+    module.__getattr__ = __getattr__
+
+
+def finalize(module: ModuleType) -> None:
+    """Replace the computed properties of a module with their current values.
+    Call this once all configuration values are set to make subsequent
+    accesses plain module attribute lookups.
+
+    Arguments
+        module
+            The configured module
+    """
+    hook = vars(module).get('__getattr__')
+    for getters in getattr(hook, 'properties', ()):
+        for name in list(getters):
+            vars(module)[name] = getattr(module, name)
+            getters.pop(name, None)
+
+
+###############################################################################
+# Temporary configuration
+###############################################################################
+
+
+@contextlib.contextmanager
+def context(
+    module: ModuleType,
+    config_module: ModuleType,
+    config: Union[str, Path],
+    refresh: Optional[Callable[[ModuleType], None]] = None
+) -> Iterator[ModuleType]:
+    """Temporarily configure a module
+
+    Arguments
+        module
+            The module to configure
+        config_module
+            The submodule containing configuration values
+        config
+            The Python file containing the updated configuration values
+        refresh
+            Optional function called with the configured module to update
+            parameters derived from configuration values. Changes it makes to
+            the module are reverted when the context is exited.
+
+    Returns
+        module
+            The module with configuration values updated until the context
+            is exited
+    """
+    module_snapshot = snapshot(module)
+    config_snapshot = snapshot(config_module)
+    config_properties = config_snapshot.get('__yapecs_properties__', {})
+    hook = module_snapshot.get('__getattr__')
+    hook_properties = getattr(hook, 'properties', None)
+    try:
+
+        # Update configuration values
+        _configure(module.__name__, config_module, config, module)
+
+        # Update parameters that the module imported from the config module.
+        # Parameters derived from configuration values (e.g., in a static
+        # config) are not recomputed.
+        attributes = vars(module)
+        for parameter, value in vars(config_module).items():
+            if parameter in config_properties or (
+                parameter in attributes and
+                attributes[parameter] is config_snapshot.get(parameter)
+            ):
+                attributes[parameter] = value
+
+        # Remove values that would hide computed properties. These include
+        # values replaced by properties and the values of properties that
+        # were already computed (e.g., by yapecs.finalize).
+        for parameter in vars(config_module)['__yapecs_properties__']:
+            attributes.pop(parameter, None)
+
+        # Update derived parameters without reloading the module
+        if refresh is not None:
+            refresh(module)
+
+        yield module
+
+    finally:
+
+        # Keep submodules imported within the context, as importing them
+        # again does not bind them to the module
+        submodules = {
+            name: value for name, value in vars(module).items()
+            if name not in module_snapshot and
+            isinstance(value, ModuleType) and
+            sys.modules.get(f'{module.__name__}.{name}') is value}
+
+        # Revert configuration
+        restore(config_module, config_snapshot)
+        restore(module, module_snapshot)
+        vars(module).update(submodules)
+        if hook_properties is not None:
+            hook.properties = hook_properties
+
+
+def snapshot(module: ModuleType) -> Dict[str, object]:
+    """Save the attributes of a module
+
+    Arguments
+        module
+            The module to save
+
+    Returns
+        snapshot
+            A copy of the module attributes
+    """
+    return dict(vars(module))
+
+
+def restore(module: ModuleType, snapshot: Dict[str, object]) -> None:
+    """Restore the attributes of a module from a snapshot
+
+    Arguments
+        module
+            The module to restore
+        snapshot
+            The module attributes returned by ``yapecs.snapshot``
+    """
+    attributes = vars(module)
+    for name in attributes.keys() - snapshot.keys():
+        del attributes[name]
+    attributes.update(snapshot)
 
 
 ###############################################################################
@@ -87,7 +437,8 @@ def configure(
 
 def compose(
     name: str,
-    config_paths: List[Union[str, Path]]
+    config_paths: List[Union[str, Path]],
+    module_names: Optional[List[str]] = None
 ) -> ModuleType:
     """Compose a configured module from a base module and list of configs
 
@@ -96,160 +447,79 @@ def compose(
             Name of the base module to configure
         config_paths
             A list of paths to yapecs config files
+        module_names
+            The ``MODULE`` names of the config files. If not provided, the
+            names are read from the config files.
 
     Returns
         composed
             A new module made from the base module and configurations
     """
-    # Create a lock to prevent multithreading issues
-    # We store the lock directly in sys.modules since that's the
-    #  shared resource that we care about (kinda genius no?)
-    if 'yapecs.COMPOSE_LOCK' in sys.modules:
+    # Lock to prevent multithreading issues, as composition modifies
+    # sys.modules and sys.argv
+    if not _COMPOSE_LOCK.acquire(blocking=False):
         raise RuntimeError(f"Two different threads tried to compose {name} at the same time")
-    sys.modules['yapecs.COMPOSE_LOCK'] = None
 
-    # Handle sys.argv changes by adding
-    # `--config config_paths[0] config_paths[1]...`
     original_argv_len = len(sys.argv)
-    if '--config' in sys.argv:
-        raise ValueError(
-            'cannot replace --config, --config must not be set in sys.argv')
-    sys.argv.append('--config')
-    assert len(config_paths) >= 1
-    for config_path in config_paths:
-        sys.argv.append(config_path)
-
-    # Temporarily remove configured modules from sys.modules to ensure
-    # that other modules are configured properly
+    config_module_names = set()
     to_restore = {}
-    config_module_names = []
-    for config_path in config_paths:
-        config_module = import_from_path('config', config_path)
-        config_module_names.append(config_module.MODULE)
-    to_delete = []
-    for module_name in copy(sys.modules).keys():
-        if module_name.split('.')[0] in config_module_names:
-            to_delete.append(module_name)
-    for module_name in to_delete:
-        to_restore[module_name] = sys.modules[module_name]
-        del sys.modules[module_name]
-
-    # Import the module
-    module = importlib.import_module(name)
-
-    # Revert sys.modules
-    for module_name, module_object in to_restore.items():
-        sys.modules[module_name] = module_object
-
-    # Revert sys.argv
-    while len(sys.argv) > original_argv_len:
-        del sys.argv[-1]
-
-    del sys.modules['yapecs.COMPOSE_LOCK']
-
-    return module
-
-
-###############################################################################
-# Argument parsing
-###############################################################################
-
-
-class ArgumentParser(argparse.ArgumentParser):
-
-    def __init__(
-        self,
-        prog=None,
-        usage=None,
-        description=None,
-        epilog=None,
-        parents=[],
-        formatter_class=argparse.HelpFormatter,
-        prefix_chars='-',
-        fromfile_prefix_chars=None,
-        argument_default=None,
-        conflict_handler='error',
-        add_help=True,
-        allow_abbrev=True,
-        exit_on_error=True
-    ):
-        """Command-line argument parsing for yapecs. If you manually define
-        a '--config' argument for use elsewhere, use argparse.ArgumentParser.
-
-        Arguments
-            prog
-                The name of the program
-                (default: ``os.path.basename(sys.argv[0])``)
-            usage
-                A usage message (default: auto-generated from arguments)
-            description
-                A description of what the program does
-            epilog
-                Text following the argument descriptions
-            parents
-                Parsers whose arguments should be copied into this one
-            formatter_class
-                HelpFormatter class for printing help messages
-            prefix_chars
-                Characters that prefix optional arguments
-            fromfile_prefix_chars
-                Characters that prefix files containing additional arguments
-            argument_default
-                The default value for all arguments
-            conflict_handler
-                String indicating how to handle conflicts
-            add_help
-                Add a -h/-help option
-            allow_abbrev
-                Allow long options to be abbreviated unambiguously
-            exit_on_error
-                Determines whether or not ArgumentParser exits with error info
-                when an error occurs
-        """
-        result = super().__init__(
-            prog=prog,
-            usage=usage,
-            description=description,
-            epilog=epilog,
-            parents=parents,
-            formatter_class=formatter_class,
-            prefix_chars=prefix_chars,
-            fromfile_prefix_chars=fromfile_prefix_chars,
-            argument_default=argument_default,
-            conflict_handler=conflict_handler,
-            add_help=add_help,
-            allow_abbrev=allow_abbrev,
-            exit_on_error=exit_on_error)
-        self.add_argument(
-            '--config',
-            help='Yapecs configuration file; added by yapecs.ArgumentParser',
-            type=Path,
-            nargs='*',
-            required=False)
-        return result
-
-    def parse_args(
-        self,
-        args: Optional[List[str]] = None,
-        namespace: Optional[argparse.Namespace] = None
-    ) -> argparse.Namespace:
-        """Parse arguments while allowing unregistered config argument
-
-        Arguments
-            args
-                Arguments to parse. Default is taken from sys.argv.
-            namespace
-                Object to hold the attributes. Default is an empty Namespace.
-
-        Returns
-            Namespace containing program arguments
-        """
-        arguments = super().parse_args(args, namespace)
-
-        if 'config' in arguments:
-            del arguments.__dict__['config']
-
-        return arguments
+    evicted = False
+    try:
+        if any(
+            os.fspath(argument).partition('=')[0] == '--config'
+            for argument in sys.argv
+        ):
+            raise ValueError(
+                'cannot replace --config, --config must not be set in sys.argv')
+        assert len(config_paths) >= 1
+        if module_names is not None:
+            if not module_names:
+                raise ValueError('module_names must not be empty')
+            config_module_names.update(module_names)
+
+        # Handle sys.argv changes by adding
+        # `--config config_paths[0] config_paths[1]...`
+        sys.argv.append('--config')
+        sys.argv.extend(config_paths)
+
+        # Temporarily remove configured modules from sys.modules to ensure
+        # that other modules are configured properly
+        if module_names is None:
+            for config_path in config_paths:
+
+                # Only execute the configuration if the name cannot be read
+                # statically
+                config_module_name = _module_name(config_path)
+                if config_module_name is None:
+                    config_module_name = import_from_path(
+                        'config',
+                        config_path).MODULE
+
+                config_module_names.add(config_module_name)
+        for module_name in list(sys.modules):
+            if module_name.partition('.')[0] in config_module_names:
+                to_restore[module_name] = sys.modules.pop(module_name)
+        evicted = True
+
+        # Import the module
+        return importlib.import_module(name)
+
+    # Revert changes even if composition fails
+    finally:
+
+        # Revert sys.modules, including configured modules that were not
+        # imported before composition. Modules are left untouched if
+        # composition fails before they are removed.
+        if evicted:
+            for module_name in list(sys.modules):
+                if module_name.partition('.')[0] in config_module_names:
+                    del sys.modules[module_name]
+            sys.modules.update(to_restore)
+
+        # Revert sys.argv
+        del sys.argv[original_argv_len:]
+
+        _COMPOSE_LOCK.release()
 
 
 ###############################################################################
@@ -270,27 +540,57 @@ def grid_search(progress_file: Union[str, os.PathLike], *args: Tuple) -> Tuple:
         current_args
             The arguments that should be used by the current process
     """
+    # Import here, as filelock is only needed for grid search
+    from filelock import FileLock
+
+    # Get number of values for each argument and number of combinations
+    sizes = [len(values) for values in args]
+    total = math.prod(sizes)
+
     # Get current progress
     progress_file = Path(progress_file)
     lock_file = FileLock(Path(str(progress_file) + '.lock'), timeout=10)
     with lock_file:
-        if not progress_file.exists():
-            progress = 0
-        else:
-            with open(progress_file) as f:
-                progress = int(f.read())
+        descriptor = os.open(progress_file, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            progress = os.read(descriptor, 32).strip()
+            progress = int(progress) if progress else 0
+
+            # Raise if finished
+            if progress >= total:
+                raise IndexError('Finished grid search')
+
+            # Write updated progress as a fixed-width integer, so that it
+            # always overwrites the previous value
+            os.lseek(descriptor, 0, os.SEEK_SET)
+            os.write(descriptor, f'{progress + 1:020d}'.encode())
+
+        finally:
+            os.close(descriptor)
+
+    # Get corresponding argument combination, in the same order as
+    # itertools.product, without enumerating all combinations
+    indices = []
+    for size in reversed(sizes):
+        progress, index = divmod(progress, size)
+        indices.append(index)
+    return tuple(
+        values[index] for values, index in zip(args, reversed(indices)))
+
 
-        # Raise if finished
-        combinations = list(itertools.product(*args))
-        if progress >= len(combinations):
-            raise IndexError('Finished grid search')
+def grid_iter(*args: Tuple) -> Iterator[Tuple]:
+    """Iterate over all combinations of a grid search without storing them
 
-        # Write updated progress
-        with open(progress_file, 'w+') as file:
-            file.write(str(progress + 1))
+    Arguments
+        args
+            Lists of argument values to perform grid search over
 
-        # Get corresponding argument combination
-        return combinations[progress]
+    Returns
+        combinations
+            The combinations of arguments, in the order used by
+            ``yapecs.grid_search``
+    """
+    return itertools.product(*args)
 
 
 ###############################################################################
@@ -311,7 +611,229 @@ def import_from_path(name: str, path: Union[Path, str]) -> ModuleType:
         module
             The imported module
     """
-    spec = importlib.util.spec_from_file_location(name, path)
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
+    path = os.fspath(path)
+    return _import_from_path(name, path, _cache_key(path))
+
+
+def _import_from_path(
+    name: str,
+    path: str,
+    key: Tuple[int, int, int, int]
+) -> ModuleType:
+    """Import module from a filesystem path with a precomputed cache key
+
+    Arguments
+        name
+            The name of the module
+        path
+            The configuration file to import
+        key
+            The cache key of the file (see _cache_key)
+
+    Returns
+        module
+            The imported module
+    """
+    # Only compile configuration files that are new or have been modified
+    try:
+        code = _CONFIG_CODE_CACHE[key]
+    except KeyError:
+        loader = importlib.machinery.SourceFileLoader(name, path)
+        code = _CONFIG_CODE_CACHE[key] = loader.get_code(name)
+
+    # The module is executed on every import, as configuration files can
+    # have side effects (e.g., yapecs.grid_search)
+    module = ModuleType(name)
+    module.__file__ = path
+    exec(code, vars(module))
+
     return module
+
+
+def _cli_configs() -> List[str]:
+    """Get the configuration files given by the ``--config`` argument
+
+    Returns
+        configs
+            The configuration files, in order
+    """
+    # Reuse configurations parsed from identical command-line arguments
+    key = tuple(sys.argv)
+    try:
+        return _ARGV_CACHE[key]
+    except KeyError:
+        pass
+
+    configs = []
+    arguments = iter([os.fspath(argument) for argument in sys.argv[1:]])
+    for argument in arguments:
+
+        # Get a single configuration given as --config=<path>
+        if argument.startswith('--config='):
+            configs.append(argument[len('--config='):])
+            break
+
+        # Get all configurations, which end at the next optional argument
+        if argument == '--config':
+            for argument in arguments:
+                if argument.startswith('--'):
+                    break
+                configs.append(argument)
+            break
+
+    # Raise if config file doesn't exist
+    for path in configs:
+        if not os.path.isfile(path):
+            raise FileNotFoundError(
+                f'Configuration file {path} does not exist')
+
+    _ARGV_CACHE[key] = configs
+    return configs
+
+
+def _cache_key(path: str) -> Tuple[int, int, int, int]:
+    """Get the key identifying the current contents of a file
+
+    Arguments
+        path
+            The file
+
+    Returns
+        key
+            The device, inode, modification time, and size of the file
+    """
+    # The device and inode identify the file through symbolic links without
+    # the additional system calls of os.path.realpath
+    info = os.stat(path)
+    return info.st_dev, info.st_ino, info.st_mtime_ns, info.st_size
+
+
+def _load_config(
+    config: Union[str, Path, ModuleType],
+    module_name: str
+) -> Optional[ModuleType]:
+    """Load a configuration if it configures a module
+
+    Arguments
+        config
+            The configuration file, or the module already loaded from it
+        module_name
+            The name of the module to configure
+
+    Returns
+        config_module
+            The loaded configuration, or None if it configures another module
+    """
+    # Use configurations that are already loaded
+    if isinstance(config, ModuleType):
+        return config if config.MODULE == module_name else None
+
+    # Stat the file once for both the module name and the compiled code
+    path = os.fspath(config)
+    key = _cache_key(path)
+
+    # Skip configurations of other modules without executing them
+    if _module_name(path, key) not in (None, module_name):
+        return None
+
+    config = _import_from_path('config', path, key)
+    return config if config.MODULE == module_name else None
+
+
+def _module_name(
+    path: Union[Path, str],
+    key: Optional[Tuple[int, int, int, int]] = None
+) -> Optional[str]:
+    """Get the module name of a configuration file without executing it
+
+    Arguments
+        path
+            The configuration file
+        key
+            The cache key of the file (see _cache_key). Computed if not given.
+
+    Returns
+        module_name
+            The ``MODULE`` of the configuration file, or None if it cannot
+            be determined without executing the file
+    """
+    path = os.fspath(path)
+    if key is None:
+        key = _cache_key(path)
+    try:
+        return _MODULE_NAME_CACHE[key]
+    except KeyError:
+        pass
+
+    loader = importlib.machinery.SourceFileLoader('config', path)
+    source = loader.get_source('config')
+
+    # Read a lone top-level string assignment without parsing the file. This
+    # is unambiguous when MODULE is mentioned nowhere else and no line can be
+    # inside a multiline string or rebind names from a star import.
+    match = _MODULE_PATTERN.search(source)
+    if (
+        match is not None and
+        source.count('MODULE') == 1 and
+        '*' not in source and
+        '"""' not in source and
+        "'''" not in source
+    ):
+        _MODULE_NAME_CACHE[key] = match.group(2)
+        return match.group(2)
+
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return None
+
+    # Find all statements that could bind MODULE
+    bindings = 0
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name):
+            bindings += node.id == 'MODULE' and isinstance(node.ctx, ast.Store)
+        elif isinstance(node, ast.alias):
+            if (node.asname or node.name) in ('MODULE', '*'):
+                return None
+        elif isinstance(
+            node,
+            (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+        ):
+            if node.name == 'MODULE':
+                return None
+
+    # Only use the name if it is assigned once at the top level as a string
+    module_name = None
+    if bindings == 1:
+        for node in tree.body:
+            if (
+                isinstance(node, ast.Assign) and
+                len(node.targets) == 1 and
+                isinstance(node.targets[0], ast.Name) and
+                node.targets[0].id == 'MODULE' and
+                isinstance(node.value, ast.Constant) and
+                isinstance(node.value.value, str)
+            ):
+                module_name = node.value.value
+
+    _MODULE_NAME_CACHE[key] = module_name
+    return module_name
+
+
+def clear_config_cache() -> None:
+    """Clear the caches of compiled configuration files"""
+    _CONFIG_CODE_CACHE.clear()
+    _MODULE_NAME_CACHE.clear()
+
+
+import_from_path.cache_clear = clear_config_cache
+
+
+def __getattr__(name):
+    # ArgumentParser is defined in yapecs.parser, so that argparse is only
+    # imported when it is used
+    if name == 'ArgumentParser':
+        from .parser import ArgumentParser
+        globals()[name] = ArgumentParser
+        return ArgumentParser
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -0,0 +1,61 @@
+import argparse
+from pathlib import Path
+from typing import List, Optional
+
+
+###############################################################################
+# Argument parsing
+###############################################################################
+
+
+class ArgumentParser(argparse.ArgumentParser):
+
+    def __init__(self, *args, **kwargs):
+        """Command-line argument parsing for yapecs. If you manually define
+        a '--config' argument for use elsewhere, use argparse.ArgumentParser.
+
+        Arguments
+            args
+                Positional arguments of argparse.ArgumentParser
+            kwargs
+                Keyword arguments of argparse.ArgumentParser
+        """
+        super().__init__(*args, **kwargs)
+
+        # Parent parsers may already define the argument
+        if '--config' not in self._option_string_actions:
+            action = self.add_argument(
+                '--config',
+                help='Yapecs configuration file; added by yapecs.ArgumentParser',
+                type=Path,
+                nargs='*',
+                required=False)
+
+            # Mark the argument, so that parsers inheriting it also remove it
+            action.yapecs = True
+
+    def parse_args(
+        self,
+        args: Optional[List[str]] = None,
+        namespace: Optional[argparse.Namespace] = None
+    ) -> argparse.Namespace:
+        """Parse arguments, removing the yapecs ``--config`` argument
+
+        Arguments
+            args
+                Arguments to parse. Default is taken from sys.argv.
+            namespace
+                Object to hold the attributes. Default is an empty Namespace.
+
+        Returns
+            Namespace containing program arguments
+        """
+        arguments = super().parse_args(args, namespace)
+
+        # Configuration files are handled by yapecs.configure, unless the
+        # argument is defined for use elsewhere
+        action = self._option_string_actions.get('--config')
+        if getattr(action, 'yapecs', False):
+            vars(arguments).pop(action.dest, None)
+
+        return arguments